@@ -1,16 +1,53 @@
 """Base agent class for standardized multi-agent architecture."""
 
 from abc import ABC
-from typing import List, Optional
+from typing import Dict, List, Optional
+import asyncio
+import hashlib
 import logging
+import os
 from beeai_framework.agents import AgentExecutionConfig
 from beeai_framework.agents.react import ReActAgent
+from beeai_framework.backend import AnyMessage, AssistantMessage, UserMessage
 from beeai_framework.tools.tool import Tool
 from beeai_framework.memory import TokenMemory
 from beeai_framework.emitter import EmitterOptions
-from backend.llm import get_llm_client
+from backend.llm import MODEL_CONTEXT_TOKENS, get_llm_client
 from backend.common.utils import process_agent_events
 
+AGENT_CONCURRENCY = int(os.getenv("AGENT_CONCURRENCY", "16"))
+
+# Once history plus the next prompt passes this share of the model context
+# window, the history is summarized so per-call prompt size stays bounded.
+MEMORY_COMPACTION_RATIO = 0.7
+
+_COMPACTION_PROMPT = (
+    "Summarize the conversation below in under 300 tokens. Keep every fact, "
+    "result and open question needed to continue it.\n\n"
+)
+
+# Summaries keyed by a hash of the transcript, so a retried run over the same
+# history does not summarize it again
+_SUMMARY_CACHE: Dict[str, str] = {}
+_SUMMARY_CACHE_SIZE = 64
+
+# Same heuristic as TokenMemory's default estimator
+_CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // _CHARS_PER_TOKEN
+
+
+def _estimate_message_tokens(messages: List[AnyMessage]) -> int:
+    return sum(_estimate_tokens(message.text) for message in messages)
+
+
+_EMITTER_OPTIONS = EmitterOptions(match_nested=False)
+_DEFAULT_EXECUTION_CONFIG = AgentExecutionConfig(
+    max_retries_per_step=6, total_max_retries=10, max_iterations=20
+)
+
 
 class BaseAgent(ABC):
     """Abstract base class for all agents in the system."""
@@ -39,14 +76,15 @@ class BaseAgent(ABC):
 
     def _create_agent(self) -> ReActAgent:
         """Create and configure the ReActAgent with tools and LLM."""
-        return ReActAgent(llm=self.llm, tools=self.tools, memory=TokenMemory(self.llm))
+        # The full window is only a backstop; _compact_memory keeps history
+        # well below it so TokenMemory never has to reject a message.
+        memory = TokenMemory(self.llm, max_tokens=MODEL_CONTEXT_TOKENS)
+        return ReActAgent(llm=self.llm, tools=self.tools, memory=memory)
 
     @staticmethod
     def _default_execution_config() -> AgentExecutionConfig:
         """Provide default execution configuration."""
-        return AgentExecutionConfig(
-            max_retries_per_step=6, total_max_retries=10, max_iterations=20
-        )
+        return _DEFAULT_EXECUTION_CONFIG
 
     async def run(self, prompt: str) -> str:
         """Run the agent with a given prompt.
@@ -57,16 +95,91 @@ class BaseAgent(ABC):
         Returns:
             Agent response text
         """
+        return await self._run_agent(self.agent, prompt)
+
+    async def run_many(
+        self, prompts: List[str], concurrency: int = AGENT_CONCURRENCY
+    ) -> List[str]:
+        """Run the agent over several prompts concurrently.
+
+        Each prompt gets its own ReActAgent (sharing this agent's LLM client) so
+        that concurrent runs do not interleave in a single memory.
+
+        Args:
+            prompts: Input prompts for the agent
+            concurrency: Maximum number of in-flight LLM requests
+
+        Returns:
+            Agent response texts, in the same order as the prompts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run_one(prompt: str) -> str:
+            async with semaphore:
+                return await self._run_agent(self._create_agent(), prompt)
+
+        return list(await asyncio.gather(*(_run_one(prompt) for prompt in prompts)))
+
+    async def _run_agent(self, agent: ReActAgent, prompt: str) -> str:
+        """Run a single prompt through the given ReActAgent."""
         self.logger.info("Starting agent execution: %s", self.name)
 
-        response = await self.agent.run(
+        prompt_tokens = _estimate_tokens(prompt)
+        if prompt_tokens > MODEL_CONTEXT_TOKENS:
+            raise ValueError(
+                f"Prompt for {self.name} (~{prompt_tokens} tokens) does not fit the "
+                f"{MODEL_CONTEXT_TOKENS} token context window (MODEL_CONTEXT_TOKENS)"
+            )
+        await self._compact_memory(agent, prompt_tokens)
+
+        history_tokens = _estimate_message_tokens(agent.memory.messages)
+        if history_tokens + prompt_tokens > MODEL_CONTEXT_TOKENS:
+            self.logger.warning(
+                "Agent %s input (%d tokens) exceeds the %d token context window",
+                self.name,
+                history_tokens + prompt_tokens,
+                MODEL_CONTEXT_TOKENS,
+            )
+
+        response = await agent.run(
             prompt=prompt,
             execution=self.execution_config,
-        ).on("*", process_agent_events, EmitterOptions(match_nested=False))
+        ).on("*", process_agent_events, _EMITTER_OPTIONS)
 
         self.logger.info("Agent execution completed: %s", self.name)
         return response.result.text
 
+    async def _compact_memory(self, agent: ReActAgent, prompt_tokens: int) -> None:
+        """Replace the agent's history with a summary once it outgrows the budget."""
+        messages = agent.memory.messages
+        history_tokens = _estimate_message_tokens(messages)
+        memory_budget = int(MODEL_CONTEXT_TOKENS * MEMORY_COMPACTION_RATIO)
+        if not messages or history_tokens + prompt_tokens <= memory_budget:
+            return
+
+        transcript = "\n".join(
+            f"{message.role}: {message.text}" for message in messages
+        )
+        key = hashlib.sha256(transcript.encode()).hexdigest()
+        summary = _SUMMARY_CACHE.get(key)
+        if summary is None:
+            output = await self.llm.create(
+                messages=[UserMessage(_COMPACTION_PROMPT + transcript)]
+            )
+            summary = output.get_text_content()
+            if len(_SUMMARY_CACHE) >= _SUMMARY_CACHE_SIZE:
+                _SUMMARY_CACHE.pop(next(iter(_SUMMARY_CACHE)))
+            _SUMMARY_CACHE[key] = summary
+
+        agent.memory.reset()
+        await agent.memory.add(AssistantMessage(summary))
+        self.logger.debug(
+            "Compacted %s memory from ~%d to ~%d tokens",
+            self.name,
+            history_tokens,
+            _estimate_tokens(summary),
+        )
+
     @property
     def agent_type(self) -> str:
         """Return the agent type for identification."""
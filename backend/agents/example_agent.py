@@ -2,15 +2,9 @@
 
 import asyncio
 import logging
-from dotenv import load_dotenv
 from beeai_framework.tools.weather import OpenMeteoTool
 from backend.agents.base import BaseAgent
 
-# Load environment variables
-load_dotenv()
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +17,9 @@ class ExampleAgent(BaseAgent):
 
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO)
+
     agent = ExampleAgent()
     logger.info("Agent created: %s", agent.name)
     # Example usage of the agent can be added here
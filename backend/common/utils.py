@@ -1,24 +1,61 @@
 """Utility functions for agent processing."""
 
 import logging
-from typing import Any
+import os
+from typing import Any, Callable, Dict
 from beeai_framework.logger import Logger
 from beeai_framework.emitter import EventMeta
 from beeai_framework.errors import FrameworkError
 
-logger = Logger("agent-utils", level=logging.DEBUG)
+# Level is configurable so agent event logging can be turned down (e.g. WARNING)
+_AGENT_LOG_LEVEL_NAME = (os.getenv("AGENT_LOG_LEVEL") or "DEBUG").upper()
+if _AGENT_LOG_LEVEL_NAME not in logging.getLevelNamesMapping():
+    raise ValueError(
+        f"Unknown AGENT_LOG_LEVEL {_AGENT_LOG_LEVEL_NAME!r}, expected one of "
+        f"{', '.join(logging.getLevelNamesMapping())}"
+    )
+AGENT_LOG_LEVEL = logging.getLevelNamesMapping()[_AGENT_LOG_LEVEL_NAME]
+
+logger = Logger("agent-utils", level=AGENT_LOG_LEVEL)
+
+
+def _on_error(data: Any) -> None:
+    logger.info("Agent 🤖: %s", FrameworkError.ensure(data.error).explain())
+
+
+def _on_retry(_data: Any) -> None:
+    logger.info("Agent 🤖: Retrying the action...")
+
+
+def _on_update(data: Any) -> None:
+    logger.info("Agent(%s) 🤖: %s", data.update.key, data.update.parsed_value)
+
+
+def _on_start(_data: Any) -> None:
+    logger.info("Agent 🤖: Starting new iteration")
+
+
+def _on_success(_data: Any) -> None:
+    logger.info("Agent 🤖: Success")
+
+
+_EVENT_HANDLERS: Dict[str, Callable[[Any], None]] = {
+    "error": _on_error,
+    "retry": _on_retry,
+    "update": _on_update,
+    "start": _on_start,
+    "success": _on_success,
+}
 
 
 def process_agent_events(data: Any, event: EventMeta) -> None:
     """Process agent events and log appropriately"""
 
-    if event.name == "error":
-        logger.info("Agent 🤖: %s", FrameworkError.ensure(data.error).explain())
-    elif event.name == "retry":
-        logger.info("Agent 🤖: Retrying the action...")
-    elif event.name == "update":
-        logger.info("Agent(%s) 🤖: %s", data.update.key, data.update.parsed_value)
-    elif event.name == "start":
-        logger.info("Agent 🤖: Starting new iteration")
-    elif event.name == "success":
-        logger.info("Agent 🤖: Success")
+    # With AGENT_LOG_LEVEL above INFO every handler's record would be dropped, so
+    # skip the handler work (e.g. FrameworkError.explain()) altogether
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    handler = _EVENT_HANDLERS.get(event.name)
+    if handler:
+        handler(data)
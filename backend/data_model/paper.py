@@ -1,24 +1,35 @@
 """Data models for research papers and related processing results."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
-from enum import Enum
+from functools import cached_property
+from typing import List, Optional, Sequence
+from enum import IntEnum
 
 
-class ProcessingStatus(Enum):
-    """Status of paper processing through the pipeline."""
+class ProcessingStatus(IntEnum):
+    """Status of paper processing through the pipeline.
 
-    DISCOVERED = "discovered"
-    EXTRACTING = "extracting"
-    EXTRACTED = "extracted"
-    ANALYZING = "analyzing"
-    ANALYZED = "analyzed"
-    DELIVERED = "delivered"
-    FAILED = "failed"
+    DISCOVERED through DELIVERED follow pipeline order. FAILED is a terminal
+    state outside that order, so exclude it before comparing progress (e.g.
+    ``status >= EXTRACTED``). Use ``.name`` when serializing.
+    """
 
+    DISCOVERED = 0
+    EXTRACTING = 1
+    EXTRACTED = 2
+    ANALYZING = 3
+    ANALYZED = 4
+    DELIVERED = 5
+    FAILED = 6
 
-@dataclass
+    def __str__(self) -> str:
+        # IntEnum would otherwise render as the bare number in logs
+        return self.name
+
+
+@dataclass(slots=True)
 class UserProfile:
     """User profile information from HuggingFace API."""
 
@@ -29,7 +40,7 @@ class UserProfile:
     follower_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserPermissions:
     """User permissions from HuggingFace API."""
 
@@ -39,7 +50,7 @@ class UserPermissions:
     is_mod: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User information from HuggingFace API."""
 
@@ -48,7 +59,7 @@ class User:
     permissions: Optional[UserPermissions] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
     """Author information from HuggingFace API."""
 
@@ -60,18 +71,18 @@ class Author:
     hidden: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperMetadata:
     """Media, links and submission metadata for a paper."""
 
-    media_urls: List[str] = field(default_factory=list)
+    media_urls: Sequence[str] = ()
     project_page: Optional[str] = None
     github_repo: Optional[str] = None
     thumbnail: Optional[str] = None
     github_stars: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperEngagement:
     """Community engagement data for a paper."""
 
@@ -80,7 +91,7 @@ class PaperEngagement:
     discussion_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperSubmission:
     """Paper submission information."""
 
@@ -90,15 +101,15 @@ class PaperSubmission:
     is_author_participating: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AIContent:
     """AI-generated content for a paper."""
 
     ai_summary: Optional[str] = None
-    ai_keywords: List[str] = field(default_factory=list)
+    ai_keywords: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperCore:
     """Core paper information."""
 
@@ -109,17 +120,35 @@ class PaperCore:
     published_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingInfo:
     """Processing information for a paper."""
 
-    discovered_at: datetime = field(default_factory=datetime.now)
+    discovered_at_ns: int = field(default_factory=time.time_ns)
     status: ProcessingStatus = ProcessingStatus.DISCOVERED
 
+    @property
+    def discovered_at(self) -> datetime:
+        """Get discovery time as a local datetime."""
+        return datetime.fromtimestamp(self.discovered_at_ns / 1e9)
+
+
+# Indexed by min(number of authors, 3)
+_AUTHOR_LIST_FORMATS = ("", "{0}", "{0} and {1}", "{0} et al.")
+
+
+def format_author_list(author_names: List[str]) -> str:
+    """Format author names as "A", "A and B" or "A et al."."""
+    return _AUTHOR_LIST_FORMATS[min(len(author_names), 3)].format(*author_names[:2])
+
 
 @dataclass
 class Paper:  # pylint: disable=too-many-public-methods
-    """Core paper metadata and information aligned with HuggingFace API."""
+    """Core paper metadata and information aligned with HuggingFace API.
+
+    Not slotted: derived values are memoized with cached_property, which
+    stores them in the instance __dict__.
+    """
 
     # Core information
     core: PaperCore
@@ -133,19 +162,12 @@ class Paper:  # pylint: disable=too-many-public-methods
     # Processing metadata
     processing: ProcessingInfo = field(default_factory=ProcessingInfo)
 
-    @property
+    @cached_property
     def author_list(self) -> str:
         """Get formatted author list string."""
-        author_names = [author.name for author in self.core.authors]
-        if len(author_names) == 1:
-            return author_names[0]
-        if len(author_names) == 2:
-            return f"{author_names[0]} and {author_names[1]}"
-        if len(author_names) > 2:
-            return f"{author_names[0]} et al."
-        return ""
+        return format_author_list([author.name for author in self.core.authors])
 
-    @property
+    @cached_property
     def url(self) -> str:
         """Get paper URL for backward compatibility."""
         return f"https://huggingface.co/papers/{self.core.id}"
@@ -155,7 +177,7 @@ class Paper:  # pylint: disable=too-many-public-methods
         """Get abstract for backward compatibility."""
         return self.core.summary
 
-    @property
+    @cached_property
     def published_date(self) -> Optional[datetime]:
         """Get published date as datetime for backward compatibility."""
         if self.core.published_at:
@@ -209,7 +231,7 @@ class Paper:  # pylint: disable=too-many-public-methods
 
     # Backward compatibility properties for nested fields
     @property
-    def media_urls(self) -> List[str]:
+    def media_urls(self) -> Sequence[str]:
         """Get media URLs for backward compatibility."""
         return self.metadata.media_urls
 
@@ -254,7 +276,7 @@ class Paper:  # pylint: disable=too-many-public-methods
         return self.ai_content.ai_summary
 
     @property
-    def ai_keywords(self) -> List[str]:
+    def ai_keywords(self) -> Sequence[str]:
         """Get AI keywords for backward compatibility."""
         return self.ai_content.ai_keywords
 
@@ -279,7 +301,7 @@ class Paper:  # pylint: disable=too-many-public-methods
         return self.submission.is_author_participating
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchAnalysis:
     """LLM analysis results for a research paper."""
 
@@ -1,15 +1,22 @@
 """Initializes LLM provider and client setup for the backend."""
 
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict
 from dotenv import load_dotenv
 from beeai_framework.backend import ChatModel, ChatModelParameters
+from beeai_framework.cache import SlidingCache
 from backend.llm.provider_type import LLMProviderType
 
 load_dotenv()
 
 LLM_PROVIDER = LLMProviderType(os.getenv("LLM_PROVIDER", LLMProviderType.OLLAMA.value))
 
+# Responses are cached per exact message list; with temperature 0 a repeated
+# prompt yields the same completion, so the round-trip to the provider is skipped.
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "256"))
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))
+
 
 def _get_model_parameters() -> Dict:
     parameters = {}
@@ -20,18 +27,33 @@ def _get_model_parameters() -> Dict:
     return parameters
 
 
+# Context window the server actually runs models with. num_ctx is not passed to
+# Ollama, so this is its default (4096 tokens); raise both together (e.g.
+# OLLAMA_CONTEXT_LENGTH on the server) to give agents more room.
+MODEL_CONTEXT_TOKENS = int(os.getenv("MODEL_CONTEXT_TOKENS") or "4096")
+
+
+# The provider is fixed for the lifetime of the process, so the model name
+# prefix and parameters are resolved once here rather than on every call.
+_MODEL_PREFIX = LLM_PROVIDER.value
+_MODEL_PARAMETERS = ChatModelParameters(**_get_model_parameters())
+
+
+@lru_cache(maxsize=None)
 def get_llm_client(
     model_name: str = "llama3.1:8b",
-) -> Any:
+    cache: bool = True,
+) -> ChatModel:
     """
     Returns an LLM client based on the specified model name and provider type.
+    Clients are shared per model name so agents reuse one connection pool.
     :param model_name:
+    :param cache: Serve repeated prompts from an in-process response cache
     :return:
     """
-    model_parameters = _get_model_parameters()
-
-    if LLM_PROVIDER == LLMProviderType.OLLAMA:
-        return ChatModel.from_name(
-            f"ollama:{model_name}", parameters=ChatModelParameters(**model_parameters)
-        )
-    return None
+    model = ChatModel.from_name(
+        f"{_MODEL_PREFIX}:{model_name}", parameters=_MODEL_PARAMETERS
+    )
+    if cache:
+        model.cache = SlidingCache(size=LLM_CACHE_SIZE, ttl=LLM_CACHE_TTL)
+    return model
@@ -4,6 +4,9 @@ from enum import Enum
 
 
 class LLMProviderType(Enum):
-    """Enum for LLM provider types."""
+    """Enum for LLM provider types.
+
+    Values double as the BeeAI provider prefix in ``ChatModel.from_name``.
+    """
 
     OLLAMA = "ollama"
@@ -1,5 +1,6 @@
 """LangGraph workflow definition for the paper-pulse pipeline."""
 
+from functools import lru_cache
 from langgraph.graph import StateGraph
 from backend.pipeline.state import PipelineState, SinglePaperState
 from backend.pipeline.nodes import (
@@ -22,8 +23,12 @@ from backend.pipeline.node_types import (
 )
 
 
+@lru_cache(maxsize=1)
 def build_single_paper_subgraph():
-    """Build subgraph for processing a single paper."""
+    """Build subgraph for processing a single paper.
+
+    The topology is static, so the compiled subgraph is built once and reused.
+    """
     subgraph = StateGraph(SinglePaperState)
 
     # Add single paper processing nodes
@@ -38,8 +43,12 @@ def build_single_paper_subgraph():
     return subgraph.compile()
 
 
+@lru_cache(maxsize=1)
 def build_graph():
-    """Build and compile the paper-pulse workflow graph."""
+    """Build and compile the paper-pulse workflow graph.
+
+    The topology is static, so the compiled graph is built once and reused.
+    """
     # Main pipeline graph
     flow = StateGraph(PipelineState)
 
@@ -47,7 +56,8 @@ def build_graph():
     flow.add_node(PAPER_DISCOVERY_NODE, paper_discovery_node)
     flow.add_node(MAP_EXTRACTION_NODE, map_extraction_node)
     flow.add_node(PROCESS_SINGLE_PAPER_NODE, process_single_paper_node)
-    flow.add_node(COLLECT_RESULTS_NODE, collect_results_node)
+    # Deferred so results are collected once, after every paper branch finishes
+    flow.add_node(COLLECT_RESULTS_NODE, collect_results_node, defer=True)
     flow.add_node(DELIVERY_NODE, delivery_node)
 
     # Set the entry point
@@ -1,11 +1,15 @@
 """Pipeline nodes implementation for paper-pulse workflow."""
 
+import atexit
 import logging
+import time
 import requests
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from langgraph.graph import END
 from langgraph.types import Command, Send
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from backend.pipeline.state import PipelineState, SinglePaperState
 from backend.pipeline.node_types import (
@@ -29,6 +33,129 @@ from backend.data_model.paper import (
     AIContent,
 )
 
+try:
+    import orjson as json_parser
+except ImportError:
+    import json as json_parser
+
+logger = logging.getLogger(__name__)
+
+# Shared HTTP session so repeated discovery calls reuse a warm keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]
+        ),
+    ),
+)
+atexit.register(_SESSION.close)
+
+# HuggingFace daily papers change at most a few times a day
+DAILY_PAPERS_CACHE_TTL = 3600
+
+# (fetched at, ETag, decoded payload) per limit. Within the TTL the payload is
+# reused without a request; after it, the ETag turns an unchanged list into a 304.
+# Only fetches that yielded papers are stored, and an HTTP or parse error drops
+# the entry, so failures are always retried and never served from the cache.
+_DAILY_PAPERS_CACHE: Dict[int, Tuple[float, Optional[str], List[Dict[str, Any]]]] = {}
+
+
+def _build_user(
+    user_data: Dict[str, Any], username_key: str, with_permissions: bool = True
+) -> User:
+    """Create a User from a HuggingFace API user object."""
+    profile = UserProfile(
+        avatar_url=user_data.get("avatarUrl"),
+        fullname=user_data.get("fullname"),
+        username=user_data.get(username_key),
+        user_type=user_data.get("type"),
+        follower_count=user_data.get("followerCount"),
+    )
+    permissions = None
+    if with_permissions:
+        permissions = UserPermissions(
+            is_pro=user_data.get("isPro"),
+            is_hf=user_data.get("isHf"),
+            is_hf_admin=user_data.get("isHfAdmin"),
+            is_mod=user_data.get("isMod"),
+        )
+    return User(id=user_data.get("_id", ""), profile=profile, permissions=permissions)
+
+
+def _build_paper(paper_data: Dict[str, Any]) -> Paper:
+    """Create a Paper from a HuggingFace API paper object."""
+    # Create Author objects
+    authors = []
+    for author_data in paper_data.get("authors", []):
+        user = None
+        if user_data := author_data.get("user"):
+            user = _build_user(user_data, username_key="user")
+        authors.append(
+            Author(
+                id=author_data.get("_id", ""),
+                name=author_data.get("name", "Unknown"),
+                user=user,
+                status=author_data.get("status"),
+                status_last_changed_at=author_data.get("statusLastChangedAt"),
+                hidden=author_data.get("hidden"),
+            )
+        )
+
+    # Create User objects for submission info
+    submitted_by = None
+    if submitted_by_data := paper_data.get("submittedBy"):
+        submitted_by = _build_user(submitted_by_data, username_key="name")
+
+    submitted_on_daily_by = None
+    if submitted_on_daily_by_data := paper_data.get("submittedOnDailyBy"):
+        submitted_on_daily_by = _build_user(
+            submitted_on_daily_by_data,
+            username_key="user",
+            with_permissions=False,
+        )
+
+    # Create Paper object with nested structure
+    return Paper(
+        core=PaperCore(
+            id=paper_data.get("id", ""),
+            title=paper_data.get("title", ""),
+            authors=authors,
+            summary=paper_data.get("summary", ""),
+            published_at=paper_data.get("publishedAt"),
+        ),
+        metadata=PaperMetadata(
+            media_urls=tuple(paper_data.get("mediaUrls") or ()),
+            project_page=paper_data.get("projectPage"),
+            github_repo=paper_data.get("githubRepo"),
+            thumbnail=paper_data.get("thumbnail"),
+            github_stars=paper_data.get("githubStars"),
+        ),
+        engagement=PaperEngagement(
+            upvotes=paper_data.get("upvotes", 0),
+            num_comments=paper_data.get("numComments", 0),
+            discussion_id=paper_data.get("discussionId"),
+        ),
+        submission=PaperSubmission(
+            submitted_by=submitted_by,
+            submitted_on_daily_by=submitted_on_daily_by,
+            submitted_on_daily_at=paper_data.get("submittedOnDailyAt"),
+            is_author_participating=paper_data.get("isAuthorParticipating"),
+        ),
+        ai_content=AIContent(
+            ai_summary=paper_data.get("ai_summary"),
+            ai_keywords=tuple(paper_data.get("ai_keywords") or ()),
+        ),
+    )
+
+
+def _build_papers(papers_data: List[Dict[str, Any]]) -> List[Paper]:
+    """Convert a daily papers API response to Paper objects."""
+    return [_build_paper(item["paper"]) for item in papers_data if "paper" in item]
+
 
 def _fetch_daily_papers(limit: int = 20) -> List[Paper]:
     """
@@ -46,140 +173,46 @@ def _fetch_daily_papers(limit: int = 20) -> List[Paper]:
     if limit:
         params["limit"] = limit
 
+    cached = _DAILY_PAPERS_CACHE.get(limit)
+    if cached and time.monotonic() - cached[0] < DAILY_PAPERS_CACHE_TTL:
+        logger.info("Using cached daily papers for limit=%s", limit)
+        return _build_papers(cached[2])
+
     try:
-        response = requests.get(base_url, params=params, timeout=30)
-        response.raise_for_status()
-        papers_data = response.json()
-
-        # Convert API response to Paper objects
-        papers = []
-        for item in papers_data:
-            if "paper" in item:
-                paper_data = item["paper"]
-
-                # Create Author objects
-                authors = []
-                for author_data in paper_data.get("authors", []):
-                    user = None
-                    if author_data.get("user"):
-                        user_data = author_data["user"]
-                        profile = UserProfile(
-                            avatar_url=user_data.get("avatarUrl"),
-                            fullname=user_data.get("fullname"),
-                            username=user_data.get("user"),
-                            user_type=user_data.get("type"),
-                            follower_count=user_data.get("followerCount"),
-                        )
-                        permissions = UserPermissions(
-                            is_pro=user_data.get("isPro"),
-                            is_hf=user_data.get("isHf"),
-                            is_hf_admin=user_data.get("isHfAdmin"),
-                            is_mod=user_data.get("isMod"),
-                        )
-                        user = User(
-                            id=user_data.get("_id", ""),
-                            profile=profile,
-                            permissions=permissions,
-                        )
-
-                    author = Author(
-                        id=author_data.get("_id", ""),
-                        name=author_data.get("name", "Unknown"),
-                        user=user,
-                        status=author_data.get("status"),
-                        status_last_changed_at=author_data.get("statusLastChangedAt"),
-                        hidden=author_data.get("hidden"),
-                    )
-                    authors.append(author)
-
-                # Create User objects for submission info
-                submitted_by = None
-                if paper_data.get("submittedBy"):
-                    sb_data = paper_data["submittedBy"]
-                    profile = UserProfile(
-                        avatar_url=sb_data.get("avatarUrl"),
-                        fullname=sb_data.get("fullname"),
-                        username=sb_data.get("name"),
-                        user_type=sb_data.get("type"),
-                        follower_count=sb_data.get("followerCount"),
-                    )
-                    permissions = UserPermissions(
-                        is_pro=sb_data.get("isPro"),
-                        is_hf=sb_data.get("isHf"),
-                        is_hf_admin=sb_data.get("isHfAdmin"),
-                        is_mod=sb_data.get("isMod"),
-                    )
-                    submitted_by = User(
-                        id=sb_data.get("_id", ""),
-                        profile=profile,
-                        permissions=permissions,
-                    )
-
-                submitted_on_daily_by = None
-                if paper_data.get("submittedOnDailyBy"):
-                    sodb_data = paper_data["submittedOnDailyBy"]
-                    profile = UserProfile(
-                        avatar_url=sodb_data.get("avatarUrl"),
-                        fullname=sodb_data.get("fullname"),
-                        username=sodb_data.get("user"),
-                        user_type=sodb_data.get("type"),
-                    )
-                    submitted_on_daily_by = User(
-                        id=sodb_data.get("_id", ""),
-                        profile=profile,
-                    )
-
-                # Create Paper object with nested structure
-                core = PaperCore(
-                    id=paper_data.get("id", ""),
-                    title=paper_data.get("title", ""),
-                    authors=authors,
-                    summary=paper_data.get("summary", ""),
-                    published_at=paper_data.get("publishedAt"),
-                )
-
-                metadata = PaperMetadata(
-                    media_urls=paper_data.get("mediaUrls", []),
-                    project_page=paper_data.get("projectPage"),
-                    github_repo=paper_data.get("githubRepo"),
-                    thumbnail=paper_data.get("thumbnail"),
-                    github_stars=paper_data.get("githubStars"),
-                )
-
-                engagement = PaperEngagement(
-                    upvotes=paper_data.get("upvotes", 0),
-                    num_comments=paper_data.get("numComments", 0),
-                    discussion_id=paper_data.get("discussionId"),
-                )
-
-                submission = PaperSubmission(
-                    submitted_by=submitted_by,
-                    submitted_on_daily_by=submitted_on_daily_by,
-                    submitted_on_daily_at=paper_data.get("submittedOnDailyAt"),
-                    is_author_participating=paper_data.get("isAuthorParticipating"),
-                )
-
-                ai_content = AIContent(
-                    ai_summary=paper_data.get("ai_summary"),
-                    ai_keywords=paper_data.get("ai_keywords", []),
-                )
-
-                paper = Paper(
-                    core=core,
-                    metadata=metadata,
-                    engagement=engagement,
-                    submission=submission,
-                    ai_content=ai_content,
-                )
-                papers.append(paper)
+        # Revalidate with the last ETag; an unchanged list comes back as an empty 304
+        headers = {}
+        if cached and cached[1]:
+            headers["If-None-Match"] = cached[1]
 
+        response = _SESSION.get(
+            base_url, params=params, headers=headers, timeout=(5, 30)
+        )
+        if cached and response.status_code == 304:
+            papers_data = cached[2]
+            # A 304 may omit the ETag; the stored one still matches the payload
+            etag = response.headers.get("ETag") or cached[1]
+        else:
+            response.raise_for_status()
+            # Parse the raw bytes directly; skips requests' charset detection
+            papers_data = json_parser.loads(response.content)
+            etag = response.headers.get("ETag")
+
+        papers = _build_papers(papers_data)
+        if papers:
+            _DAILY_PAPERS_CACHE[limit] = (
+                time.monotonic(),
+                etag,
+                papers_data,
+            )
         return papers
 
     except requests.RequestException as e:
-        logging.error(f"Failed to fetch papers from Hugging Face API: {str(e)}")
+        logger.error("Failed to fetch papers from Hugging Face API: %s", e)
+        _DAILY_PAPERS_CACHE.pop(limit, None)
         return []
     except Exception as e:
-        logging.error(f"Error processing papers data: {str(e)}")
+        logger.error("Error processing papers data: %s", e)
+        _DAILY_PAPERS_CACHE.pop(limit, None)
         return []
 
 
@@ -190,21 +223,21 @@ def paper_discovery_node(state: PipelineState) -> Command:
     Fetches papers from configured sources, (TO-DO filters by categories and keywords),
     and updates state with discovered papers.
     """
-    logging.info(f"Starting paper discovery for pipeline {state['pipeline_id']}")
+    logger.info("Starting paper discovery for pipeline %s", state["pipeline_id"])
 
     # Get user preferences for filtering
     settings = state.get("settings", {})
     limit = settings.get("limit", 10)
 
-    logging.info(f"Fetching papers with limit={limit}")
+    logger.info("Fetching papers with limit=%s", limit)
 
     papers = _fetch_daily_papers(limit=limit)
 
     if not papers:
-        logging.warning("No papers fetched from Hugging Face API")
+        logger.warning("No papers fetched from Hugging Face API")
         return Command(goto=END, update={"error": "No papers fetched"})
 
-    logging.info("Paper discovery completed - proceeding to map extraction")
+    logger.info("Paper discovery completed - proceeding to map extraction")
 
     return Command(goto=MAP_EXTRACTION_NODE, update={"discovered_papers": papers})
 
@@ -214,32 +247,31 @@ def map_extraction_node(state: PipelineState) -> Command:
     Map each discovered paper to individual extraction processing.
 
     Uses Send commands to process papers in parallel via subgraph invocation.
+    Only Paper instances are sent, so the per-paper nodes never handle raw dicts.
     """
-    logging.info(f"Mapping papers for extraction in pipeline {state['pipeline_id']}")
+    pipeline_id = state["pipeline_id"]
+    papers = state.get("discovered_papers")
+
+    logger.info("Mapping papers for extraction in pipeline %s", pipeline_id)
 
-    if not state.get("discovered_papers"):
-        logging.info("No papers discovered - proceeding to delivery")
+    if not papers:
+        logger.info("No papers discovered - proceeding to delivery")
         return Command(goto=DELIVERY_NODE, update={"processing_complete": True})
 
-    paper_count = len(state["discovered_papers"])
-    logging.info(
-        f"Mapping {paper_count} papers for parallel processing via Send commands"
+    logger.info(
+        "Mapping %d papers for parallel processing via Send commands", len(papers)
     )
 
-    # Create Send commands for parallel processing
-    send_commands = []
-    for idx, paper in enumerate(state["discovered_papers"]):
-        paper_state = {
-            "paper": paper,
-            "paper_index": idx,
-            "pipeline_id": state["pipeline_id"],
-            "extracted_content": None,
-            "analysis": None,
-            "errors": None,
-        }
-        send_commands.append(Send(PROCESS_SINGLE_PAPER_NODE, paper_state))
-
-    logging.info(f"Created {len(send_commands)} Send commands for parallel processing")
+    # Create Send commands for parallel processing; result fields start unset
+    send_commands = [
+        Send(
+            PROCESS_SINGLE_PAPER_NODE,
+            {"paper": paper, "paper_index": idx, "pipeline_id": pipeline_id},
+        )
+        for idx, paper in enumerate(papers)
+    ]
+
+    logger.info("Created %d Send commands for parallel processing", len(send_commands))
 
     return Command(goto=send_commands, update={"parallel_processing_started": True})
 
@@ -256,22 +288,25 @@ def process_single_paper_node(state: SinglePaperState) -> Command:
     paper_index = state["paper_index"]
     pipeline_id = state["pipeline_id"]
 
-    logging.info(
-        f"[Pipeline {pipeline_id}] [Paper {paper_index}] Processing paper via subgraph: {paper.title}"
+    logger.info(
+        "[Pipeline %s] [Paper %d] Processing paper via subgraph: %s",
+        pipeline_id,
+        paper_index,
+        paper.title,
     )
 
     # Build and invoke the subgraph
     subgraph = build_single_paper_subgraph()
     result = subgraph.invoke(state)
 
-    logging.info(
-        f"[Pipeline {pipeline_id}] [Paper {paper_index}] Subgraph processing completed"
+    logger.info(
+        "[Pipeline %s] [Paper %d] Subgraph processing completed",
+        pipeline_id,
+        paper_index,
     )
 
-    # Create unique keys to avoid conflicts when updating main state
-    result_key = f"paper_result_{paper_index}_{pipeline_id.replace('-', '_')}"
-
-    return Command(goto=COLLECT_RESULTS_NODE, update={result_key: result})
+    # The paper_results reducer appends this branch's result to the main state
+    return Command(goto=COLLECT_RESULTS_NODE, update={"paper_results": [result]})
 
 
 def extract_single_paper_node(state: SinglePaperState) -> Command:
@@ -288,21 +323,21 @@ def extract_single_paper_node(state: SinglePaperState) -> Command:
     paper_index = state["paper_index"]
     pipeline_id = state["pipeline_id"]
 
-    if hasattr(paper, "title"):
-        paper_title = paper.title
-        paper_id = paper.id
-        author_list = paper.author_list
-    else:
-        paper_title = paper.get("title", "Unknown")
-        paper_id = paper.get("id", "unknown")
-        author_list = "Unknown authors"
-
-    logging.info(
-        f"[Pipeline {pipeline_id}] [Paper {paper_index}] Starting extraction for: {paper_title}"
+    paper_title = paper.title
+    paper_id = paper.id
+    author_list = paper.author_list
+
+    logger.info(
+        "[Pipeline %s] [Paper %d] Starting extraction for: %s",
+        pipeline_id,
+        paper_index,
+        paper_title,
     )
-    logging.info(f"[Pipeline {pipeline_id}] [Paper {paper_index}] Paper ID: {paper_id}")
-    logging.info(
-        f"[Pipeline {pipeline_id}] [Paper {paper_index}] Authors: {author_list}"
+    logger.info(
+        "[Pipeline %s] [Paper %d] Paper ID: %s", pipeline_id, paper_index, paper_id
+    )
+    logger.info(
+        "[Pipeline %s] [Paper %d] Authors: %s", pipeline_id, paper_index, author_list
     )
 
     # TODO: Add single paper extraction implementation
@@ -314,8 +349,10 @@ def extract_single_paper_node(state: SinglePaperState) -> Command:
         "extraction_timestamp": datetime.now().isoformat(),
     }
 
-    logging.info(
-        f"[Pipeline {pipeline_id}] [Paper {paper_index}] Content extraction completed - proceeding to analysis"
+    logger.info(
+        "[Pipeline %s] [Paper %d] Content extraction completed - proceeding to analysis",
+        pipeline_id,
+        paper_index,
     )
 
     return Command(
@@ -338,31 +375,39 @@ def analyze_single_paper_node(state: SinglePaperState) -> Command:
     pipeline_id = state["pipeline_id"]
     extracted_content = state.get("extracted_content", {})
 
-    if hasattr(paper, "title"):
-        paper_title = paper.title
-        paper_id = paper.id
-        ai_summary = paper.ai_summary
-        ai_keywords = paper.ai_keywords
-    else:
-        paper_title = paper.get("title", "Unknown")
-        paper_id = paper.get("id", "unknown")
-        ai_summary = paper.get("ai_summary")
-        ai_keywords = paper.get("ai_keywords", [])
-
-    logging.info(
-        f"[Pipeline {pipeline_id}] [Paper {paper_index}] Starting analysis for: {paper_title}"
+    paper_title = paper.title
+    paper_id = paper.id
+    ai_summary = paper.ai_summary
+    ai_keywords = paper.ai_keywords
+
+    logger.info(
+        "[Pipeline %s] [Paper %d] Starting analysis for: %s",
+        pipeline_id,
+        paper_index,
+        paper_title,
     )
-    logging.info(
-        f"[Pipeline {pipeline_id}] [Paper {paper_index}] Using extracted content from: {extracted_content.get('extraction_timestamp', 'unknown time')}"
+    logger.info(
+        "[Pipeline %s] [Paper %d] Using extracted content from: %s",
+        pipeline_id,
+        paper_index,
+        extracted_content.get("extraction_timestamp", "unknown time"),
     )
-    if ai_summary:
-        logging.info(
-            f"[Pipeline {pipeline_id}] [Paper {paper_index}] AI Summary available: {ai_summary[:100]}..."
-        )
-    if ai_keywords:
-        logging.info(
-            f"[Pipeline {pipeline_id}] [Paper {paper_index}] AI Keywords: {', '.join(ai_keywords[:5])}"
-        )
+    # Slicing and joining are skipped entirely when INFO is filtered out
+    if logger.isEnabledFor(logging.INFO):
+        if ai_summary:
+            logger.info(
+                "[Pipeline %s] [Paper %d] AI Summary available: %s...",
+                pipeline_id,
+                paper_index,
+                ai_summary[:100],
+            )
+        if ai_keywords:
+            logger.info(
+                "[Pipeline %s] [Paper %d] AI Keywords: %s",
+                pipeline_id,
+                paper_index,
+                ", ".join(ai_keywords[:5]),
+            )
 
     # TODO: Add single paper analysis implementation
     # analysis = analyze_paper_content(state["extracted_content"])
@@ -375,8 +420,10 @@ def analyze_single_paper_node(state: SinglePaperState) -> Command:
         "analysis_timestamp": datetime.now().isoformat(),
     }
 
-    logging.info(
-        f"[Pipeline {pipeline_id}] [Paper {paper_index}] Analysis completed - proceeding to collect results"
+    logger.info(
+        "[Pipeline %s] [Paper %d] Analysis completed - proceeding to collect results",
+        pipeline_id,
+        paper_index,
     )
 
     return Command(goto=END, update={"analysis": analysis})
@@ -390,54 +437,61 @@ def collect_results_node(state: PipelineState) -> Command:
     """
     pipeline_id = state.get("pipeline_id", "unknown")
 
-    # Find all paper result keys in the state
-    paper_results = {}
-    for key, value in state.items():
-        if key.startswith("paper_result_") and isinstance(value, dict):
-            paper_results[key] = value
+    paper_results = state.get("paper_results", [])
 
     paper_count = len(paper_results)
-    logging.info(
-        f"[Pipeline {pipeline_id}] Collecting results from {paper_count} papers"
+    logger.info(
+        "[Pipeline %s] Collecting results from %d papers", pipeline_id, paper_count
     )
 
-    # Aggregate results from all papers
-    processed_papers = []
-    extraction_results = {}
-    analysis_results = {}
+    # Aggregate results from all papers into lists pre-sized to the discovered
+    # papers and positioned by paper index, so discovery order is preserved
+    result_count = len(state.get("discovered_papers", []))
+    processed_papers: List[Optional[Paper]] = [None] * result_count
+    extraction_results: List[Optional[Dict[str, Any]]] = [None] * result_count
+    analysis_results: List[Optional[Dict[str, Any]]] = [None] * result_count
+
+    # Per-paper details are batched into a single record, built only if logged
+    log_details = logger.isEnabledFor(logging.INFO)
+    details = []
 
-    for result_key, paper_result in paper_results.items():
+    for paper_result in paper_results:
         paper_idx = paper_result.get("paper_index", 0)
         paper = paper_result.get("paper")
-        processed_papers.append(paper)
-
-        # Log individual paper completion
-        if hasattr(paper, "title"):
-            paper_title = paper.title
-        else:
-            paper_title = paper.get("title", "Unknown") if paper else "Unknown"
-
-        logging.info(
-            f"[Pipeline {pipeline_id}] Collected results for paper {paper_idx}: {paper_title}"
-        )
+        processed_papers[paper_idx] = paper
 
         if "extracted_content" in paper_result:
             extraction_results[paper_idx] = paper_result["extracted_content"]
-            logging.info(
-                f"[Pipeline {pipeline_id}] Paper {paper_idx}: Extraction completed at {paper_result['extracted_content'].get('extraction_timestamp', 'unknown time')}"
-            )
 
         if "analysis" in paper_result:
             analysis_results[paper_idx] = paper_result["analysis"]
-            logging.info(
-                f"[Pipeline {pipeline_id}] Paper {paper_idx}: Analysis completed at {paper_result['analysis'].get('analysis_timestamp', 'unknown time')}"
+
+        if log_details:
+            extracted_at = (paper_result.get("extracted_content") or {}).get(
+                "extraction_timestamp", "unknown time"
+            )
+            analyzed_at = (paper_result.get("analysis") or {}).get(
+                "analysis_timestamp", "unknown time"
+            )
+            details.append(
+                f"  Paper {paper_idx}: {paper.title} "
+                f"(extracted at {extracted_at}, analyzed at {analyzed_at})"
             )
 
-    logging.info(
-        f"[Pipeline {pipeline_id}] Results collection completed - proceeding to delivery"
+    if details:
+        logger.info(
+            "[Pipeline %s] Collected results:\n%s", pipeline_id, "\n".join(details)
+        )
+
+    logger.info(
+        "[Pipeline %s] Results collection completed - proceeding to delivery",
+        pipeline_id,
     )
-    logging.info(
-        f"[Pipeline {pipeline_id}] Summary: {len(extraction_results)} extractions, {len(analysis_results)} analyses"
+    logger.info(
+        "[Pipeline %s] Summary: %d extractions, %d analyses",
+        pipeline_id,
+        sum(result is not None for result in extraction_results),
+        sum(result is not None for result in analysis_results),
     )
 
     return Command(
@@ -461,7 +515,7 @@ def delivery_node(state: PipelineState) -> Command:
     - Send to configured channels
     - Update delivery status
     """
-    logging.info(f"Starting delivery for pipeline {state['pipeline_id']}")
+    logger.info("Starting delivery for pipeline %s", state["pipeline_id"])
 
     # TODO: Add delivery implementation
     delivery_status = {
@@ -471,6 +525,6 @@ def delivery_node(state: PipelineState) -> Command:
         "paper_count": len(state.get("processed_papers", [])),
     }
 
-    logging.info(f"Delivery completed for pipeline {state['pipeline_id']}")
+    logger.info("Delivery completed for pipeline %s", state["pipeline_id"])
 
     return Command(goto=END, update={"delivery_status": delivery_status})
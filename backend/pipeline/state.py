@@ -1,6 +1,7 @@
 """Pipeline state definition for paper-pulse workflow."""
 
-from typing import TypedDict, List, Dict, Any, Optional
+import operator
+from typing import Annotated, TypedDict, List, Dict, Any, Optional
 from datetime import datetime
 from backend.data_model.paper import Paper
 
@@ -14,6 +15,14 @@ class PipelineState(TypedDict):
     # Paper Discovery output
     discovered_papers: List[Paper]
 
+    # Per-paper subgraph results, appended by each parallel branch
+    paper_results: Annotated[List[Dict[str, Any]], operator.add]
+
+    # Results collection output (per-paper results are indexed by paper index)
+    processed_papers: List[Optional[Paper]]
+    extraction_results: List[Optional[Dict[str, Any]]]
+    analysis_results: List[Optional[Dict[str, Any]]]
+
     # Metadata
     pipeline_id: str
     start_time: Optional[datetime]
@@ -54,18 +54,11 @@ def main():
         if discovered_papers:
             logging.info("Successfully discovered %d papers:", len(discovered_papers))
             for i, paper in enumerate(discovered_papers):
-                if hasattr(paper, "title"):
-                    # Paper object
-                    logging.info("  %d. %s", i + 1, paper.title)
-                    logging.info("      Authors: %s", paper.author_list)
-                    logging.info("      Upvotes: %d", paper.upvotes)
-                    if paper.ai_keywords:
-                        logging.info(
-                            "      Keywords: %s", ", ".join(paper.ai_keywords[:3])
-                        )
-                else:
-                    # Fallback for dict
-                    logging.info("  %d. %s", i + 1, paper.get("title", "No title"))
+                logging.info("  %d. %s", i + 1, paper.title)
+                logging.info("      Authors: %s", paper.author_list)
+                logging.info("      Upvotes: %d", paper.upvotes)
+                if paper.ai_keywords:
+                    logging.info("      Keywords: %s", ", ".join(paper.ai_keywords[:3]))
 
     except Exception as e:
         logging.error("Pipeline execution failed: %s", str(e))
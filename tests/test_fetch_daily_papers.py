@@ -0,0 +1,139 @@
+"""Tests for the daily papers fetch cache in backend.pipeline.nodes."""
+
+import json
+import unittest
+from unittest import mock
+
+import requests
+
+from backend.pipeline import nodes
+
+PAYLOAD = [
+    {
+        "paper": {
+            "id": "2401.00001",
+            "title": "Cached Paper",
+            "mediaUrls": ["https://example.com/figure.png"],
+            "ai_keywords": ["caching"],
+        }
+    }
+]
+
+
+def _response(status_code=200, payload=None, etag='W/"v1"'):
+    """Build a mocked requests.Response for the daily papers endpoint."""
+    response = mock.Mock(status_code=status_code)
+    response.content = b"" if payload is None else json.dumps(payload).encode()
+    response.headers = {"ETag": etag} if etag else {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return response
+
+
+class FetchDailyPapersCacheTest(unittest.TestCase):
+    """Cache behaviour of _fetch_daily_papers with a mocked HTTP session."""
+
+    def setUp(self):
+        nodes._DAILY_PAPERS_CACHE.clear()
+        patcher = mock.patch.object(nodes._SESSION, "get")
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(nodes._DAILY_PAPERS_CACHE.clear)
+
+    def _expire_cache(self):
+        patcher = mock.patch.object(nodes, "DAILY_PAPERS_CACHE_TTL", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_ttl_hit_skips_request(self):
+        self.get.return_value = _response(payload=PAYLOAD)
+
+        first = nodes._fetch_daily_papers(limit=5)
+        second = nodes._fetch_daily_papers(limit=5)
+
+        self.assertEqual(self.get.call_count, 1)
+        self.assertEqual([p.title for p in second], ["Cached Paper"])
+        # Papers are rebuilt from the payload, not shared between runs
+        self.assertIsNot(first[0], second[0])
+
+    def test_cache_is_keyed_on_limit(self):
+        self.get.return_value = _response(payload=PAYLOAD)
+
+        nodes._fetch_daily_papers(limit=5)
+        nodes._fetch_daily_papers(limit=10)
+
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_expired_entry_revalidates_and_reuses_payload_on_304(self):
+        self.get.return_value = _response(payload=PAYLOAD)
+        nodes._fetch_daily_papers(limit=5)
+        self._expire_cache()
+
+        self.get.return_value = _response(status_code=304)
+        papers = nodes._fetch_daily_papers(limit=5)
+
+        self.assertEqual(
+            self.get.call_args.kwargs["headers"], {"If-None-Match": 'W/"v1"'}
+        )
+        self.assertEqual([p.title for p in papers], ["Cached Paper"])
+
+    def test_304_without_etag_keeps_stored_etag(self):
+        self.get.return_value = _response(payload=PAYLOAD)
+        nodes._fetch_daily_papers(limit=5)
+        self._expire_cache()
+
+        self.get.return_value = _response(status_code=304, etag=None)
+        nodes._fetch_daily_papers(limit=5)
+        nodes._fetch_daily_papers(limit=5)
+
+        self.assertEqual(
+            self.get.call_args.kwargs["headers"], {"If-None-Match": 'W/"v1"'}
+        )
+
+    def test_empty_result_is_not_cached(self):
+        self.get.return_value = _response(payload=[])
+
+        self.assertEqual(nodes._fetch_daily_papers(limit=5), [])
+        self.assertNotIn(5, nodes._DAILY_PAPERS_CACHE)
+
+        self.get.return_value = _response(payload=PAYLOAD)
+        self.assertEqual(len(nodes._fetch_daily_papers(limit=5)), 1)
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_http_error_invalidates_entry(self):
+        self.get.return_value = _response(payload=PAYLOAD)
+        nodes._fetch_daily_papers(limit=5)
+        self._expire_cache()
+
+        self.get.return_value = _response(status_code=503)
+        self.assertEqual(nodes._fetch_daily_papers(limit=5), [])
+        self.assertNotIn(5, nodes._DAILY_PAPERS_CACHE)
+
+        # Without the entry the next fetch is unconditional
+        self.get.return_value = _response(payload=PAYLOAD)
+        nodes._fetch_daily_papers(limit=5)
+        self.assertEqual(self.get.call_args.kwargs["headers"], {})
+
+    def test_connection_error_invalidates_entry(self):
+        self.get.return_value = _response(payload=PAYLOAD)
+        nodes._fetch_daily_papers(limit=5)
+        self._expire_cache()
+
+        self.get.side_effect = requests.ConnectionError("unreachable")
+        self.assertEqual(nodes._fetch_daily_papers(limit=5), [])
+        self.assertNotIn(5, nodes._DAILY_PAPERS_CACHE)
+
+    def test_parse_error_invalidates_entry(self):
+        self.get.return_value = _response(payload=PAYLOAD)
+        nodes._fetch_daily_papers(limit=5)
+        self._expire_cache()
+
+        response = _response()
+        response.content = b"not json"
+        self.get.return_value = response
+        self.assertEqual(nodes._fetch_daily_papers(limit=5), [])
+        self.assertNotIn(5, nodes._DAILY_PAPERS_CACHE)
+
+
+if __name__ == "__main__":
+    unittest.main()